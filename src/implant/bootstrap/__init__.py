@@ -16,8 +16,8 @@
 import base64
 import inspect
 import logging
+import lzma
 import types
-import zlib
 
 import pkg_resources
 
@@ -56,7 +56,8 @@ class Bootstrap(dict):
             code_source = code
             self.code_path = 'remote-string://'
 
-        self.code = base64.b64encode(zlib.compress(code_source, 9)).decode()
+        self.code = base64.b64encode(lzma.compress(
+            code_source, preset=9 | lzma.PRESET_EXTREME)).decode()
         raw_len = len(code_source)
         comp_len = len(self.code)
         log.debug("Code compression ratio of %s -> %s: %.2f%%",
@@ -65,8 +66,8 @@ class Bootstrap(dict):
         msgpack_code_source = inspect.getsource(msgpack).encode()
         self.msgpack_code_path = 'remote://{}'.format(
             inspect.getsourcefile(msgpack))
-        self.msgpack_code = base64.b64encode(
-            zlib.compress(msgpack_code_source, 9)).decode(),
+        self.msgpack_code = base64.b64encode(lzma.compress(
+            msgpack_code_source, preset=9 | lzma.PRESET_EXTREME)).decode(),
 
     def formatsourcelines(self, lines):
         """Remove full line comments."""
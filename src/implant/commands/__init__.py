@@ -16,8 +16,6 @@
 Core features
 """
 
-import asyncio
-import concurrent
 import logging
 import os
 import time
@@ -73,19 +71,13 @@ class Copy(core.Command):
     src = core.Parameter(description='Source file at local side.')
     dest = core.Parameter(description='Desatination file at remote side.')
 
-    def __init__(self, *args, **kwargs):
-        super(Copy, self).__init__(*args, **kwargs)
-
-        self.executor = concurrent.futures.ThreadPoolExecutor()
-        self.loop = asyncio.get_event_loop()
-
-    def __del__(self):
-        self.executor.shutdown(wait=True)
-
     async def local(self, context):
+        # file io runs in the loop's shared default executor instead of
+        # spawning a thread pool per command instance
+        loop = context.loop
         with open(self.src, "rb") as f:
             while True:
-                data = await self.loop.run_in_executor(self.executor, f.read, 0x8000)
+                data = await loop.run_in_executor(None, f.read, 0x8000)
                 if not data:
                     context.channel.send(StopAsyncIteration())
                     break
@@ -94,6 +86,7 @@ class Copy(core.Command):
         return result
 
     async def remote(self, context):
+        loop = context.loop
         with open(self.dest, "wb") as f:
             async for data in context.channel:
-                await self.loop.run_in_executor(self.executor, f.write, data)
+                await loop.run_in_executor(None, f.write, data)
@@ -23,6 +23,7 @@ import asyncio
 import collections
 import concurrent
 import functools
+import hashlib
 import importlib.abc
 import importlib.machinery
 import importlib.util
@@ -32,6 +33,7 @@ import os
 import signal
 import struct
 import sys
+import threading
 import time
 import traceback
 import uuid
@@ -46,20 +48,24 @@ PY_352 = sys.version_info >= (3, 5, 2)
 log = logging.getLogger(__name__)
 
 
-class reify:
+if hasattr(functools, 'cached_property'):
+    # C implemented and semantically identical since python 3.8
+    reify = functools.cached_property
+else:
+    class reify:
 
-    """Taken from pyramid: create a cached property."""
+        """Taken from pyramid: create a cached property."""
 
-    def __init__(self, wrapped):
-        self.wrapped = wrapped
-        functools.update_wrapper(self, wrapped)
+        def __init__(self, wrapped):
+            self.wrapped = wrapped
+            functools.update_wrapper(self, wrapped)
 
-    def __get__(self, inst, objtype=None):
-        if inst is None:
-            return self
-        val = self.wrapped(inst)
-        setattr(inst, self.wrapped.__name__, val)
-        return val
+        def __get__(self, inst, objtype=None):
+            if inst is None:
+                return self
+            val = self.wrapped(inst)
+            setattr(inst, self.wrapped.__name__, val)
+            return val
 
 
 @msgpack.register(object, 0x01)
@@ -156,6 +162,8 @@ class Uid(uuid.UUID):
 
     """A unique id, which is basically a :py:obj:`python:uuid.uuid1` instance."""
 
+    __slots__ = ()
+
     def __init__(self, bytes=None):     # pylint: disable=W0622
         if bytes is None:
             super().__init__(bytes=uuid.uuid1().bytes, version=1)
@@ -168,13 +176,30 @@ class Uid(uuid.UUID):
         uid_time = (super().time - 0x01b21dd213814000) * 100 / 1e9
         return uid_time
 
+    _interned = {}
+    """A bounded cache of shared instances keyed by their raw bytes."""
+
+    @classmethod
+    def intern(cls, bytes):     # pylint: disable=W0622
+        """Return a shared instance for the given 16 raw bytes.
+
+        Every part of a message repeats the same uid in its header, so
+        decoding resolves all of them to one instance.
+        """
+        uid = cls._interned.get(bytes)
+        if uid is None:
+            if len(cls._interned) >= 1024:
+                cls._interned.clear()
+            uid = cls._interned[bytes] = cls(bytes=bytes)
+        return uid
+
     @classmethod
     def __msgpack_encode__(cls, data, data_type):
         return data.bytes
 
     @classmethod
     def __msgpack_decode__(cls, encoded, data_type):
-        return cls(bytes=encoded)
+        return cls.intern(bytes(encoded))
 
 
 class ConnectionLostStreamReaderProtocol(asyncio.StreamReaderProtocol):
@@ -194,8 +219,12 @@ class Incomming(asyncio.StreamReader):
 
     """A context for an incomming pipe."""
 
-    def __init__(self, *, connection_lost_cb=None, pipe=sys.stdin, loop=None):
+    def __init__(self, *, connection_lost_cb=None, pipe=None, loop=None):
         super(Incomming, self).__init__(loop=loop)
+        if pipe is None:
+            # resolve at call time, sys.stdin may have been replaced
+            # since module import
+            pipe = sys.stdin
         self.pipe = os.fdopen(pipe) if isinstance(pipe, int) else pipe
         self.connection_lost_cb = connection_lost_cb
 
@@ -227,25 +256,17 @@ class Incomming(asyncio.StreamReader):
         """Read exactly n bytes from the stream.
 
         This is a short and faster implementation then the original one
-        (see of https://github.com/python/asyncio/issues/394).
+        (see of https://github.com/python/asyncio/issues/394), built on
+        the public :py:meth:`read` instead of the reader internals.
 
         """
-        buffer, missing = bytearray(), n
+        buffer = bytearray()
 
-        while missing:
-            if not self._buffer:
-                await self._wait_for_data('readexactly')
-
-            if self._eof or not self._buffer:
+        while len(buffer) < n:
+            block = await self.read(n - len(buffer))
+            if not block:
                 raise asyncio.IncompleteReadError(bytes(buffer), n)
-
-            length = min(len(self._buffer), missing)
-            buffer.extend(self._buffer[:length])
-
-            del self._buffer[:length]
-            missing -= length
-
-            self._maybe_resume_transport()
+            buffer.extend(block)
 
         return buffer
 
@@ -254,8 +275,10 @@ class Outgoing:
 
     """A context for an outgoing pipe."""
 
-    def __init__(self, *, pipe=sys.stdout, reader=None, loop=None):
+    def __init__(self, *, pipe=None, reader=None, loop=None):
         self.loop = loop if loop is not None else asyncio.get_event_loop()
+        if pipe is None:
+            pipe = sys.stdout
         self.pipe = os.fdopen(pipe) if isinstance(pipe, int) else pipe
         self.transport = None
         self.reader = reader
@@ -286,11 +309,11 @@ class Outgoing:
 
 def split_data(data, size=1024):
     """Create a generator to split data into chunks."""
-    data_view, data_len, start = memoryview(data), len(data), 0
-    while start < data_len:
-        end = min(start + size, data_len)
-        yield data_view[start:end]
-        start = end
+    # slicing a memoryview is bounds-clamped, so a plain range loop
+    # replaces the index arithmetic per part
+    data_view = memoryview(data)
+    for start in range(0, len(data_view), size):
+        yield data_view[start:start + size]
 
 
 class OrderedMeta(type):
@@ -369,18 +392,20 @@ class HeaderItem(BaseHeaderItem):
     def __init__(self, fmt, **kwargs):
         super().__init__(**kwargs)
         self.fmt = fmt
+        self.struct = struct.Struct(fmt)
+        """The compiled format, shared by all encode/decode calls."""
 
     @property
     def size(self):
         """The size of the item."""
-        return struct.calcsize(self.fmt)
+        return self.struct.size
 
     def encode(self, value):
         value = super().encode(value)
-        return struct.pack(self.fmt, value or self.default)
+        return self.struct.pack(value or self.default)
 
     def decode(self, value):
-        value, = struct.unpack_from(self.fmt, value, self.index)
+        value, = self.struct.unpack_from(value, self.index)
         return value
 
 
@@ -393,9 +418,8 @@ class Flag(BaseHeaderItem):
         return 0 if not value else value << self.index
 
     def decode(self, value):
-        value, = struct.unpack_from('!1B', value, 0)
-        value = value >> self.index & 1
-        return value
+        # the flag byte is just an indexed int, no struct needed
+        return value[0] >> self.index & 1
 
 
 class HeaderMeta(type):
@@ -406,6 +430,15 @@ class HeaderMeta(type):
         items = dct['items'] = OrderedMeta.ordered_items(
             dct, (Flag, HeaderItem))
         dct['size'] = mcs.apply_items_index(items)
+        # combine all non-flag items into a single struct, so decoding
+        # a received header is one C call instead of one call per item
+        value_items = dct['value_items'] = [
+            (item_name, item) for item_name, item in items.items()
+            if isinstance(item, HeaderItem)
+        ]
+        dct['value_struct'] = struct.Struct(
+            '!' + ''.join(item.fmt.lstrip('!') for _, item in value_items))
+        dct['value_offset'] = value_items[0][1].index if value_items else 0
         cls = type.__new__(mcs, name, bases, dct)
         if sys.version_info < (3, 6):
             for item_name, item in items.items():
@@ -428,9 +461,36 @@ class HeaderMeta(type):
                 item_size += item.size
         return item_size
 
+    def encode_flags(cls, **flags):
+        """Encode the given flags into their bit field value."""
+        value = 0
+        for name, flag in flags.items():
+            if flag:
+                value |= 1 << cls.items[name].index
+        return value
+
+    def encode_frame(cls, flags, *values):
+        """Assemble raw header bytes from precomputed flag bits and
+        item values.
+
+        This is the fast path for the sender, where all items are
+        already encoded and the bytes go straight to the wire, so no
+        header instance is created at all.
+        """
+        return bytes((flags,)) + cls.value_struct.pack(*values)
+
+    def decode_value_items(cls, inst):
+        """Decode all non-flag items of ``inst`` with a single unpack."""
+        values = cls.value_struct.unpack_from(inst, cls.value_offset)
+        for (name, item), value in zip(cls.value_items, values):
+            if item.decoder:
+                value = item.decoder(value, item)
+            setattr(inst, name, value)
+
     def __call__(cls, encoded_bytes=None, **items):
         if encoded_bytes:
             inst = super().__call__(encoded_bytes)
+            cls.decode_value_items(inst)
             return inst
 
         flags = 0
@@ -456,7 +516,7 @@ class Header(bytes, metaclass=HeaderMeta):
     recv_ack = Flag()
     compression = Flag()
     uid = HeaderItem('!16s', encoder=lambda uid, _: uid.bytes,
-                     decoder=lambda x, _: Uid(bytes=x))
+                     decoder=lambda x, _: Uid.intern(x))
     channel_name_len = HeaderItem('!H', default=0)
     data_len = HeaderItem('!I', default=0)
 
@@ -474,6 +534,23 @@ class Channels:
 
     chunk_size = 0x8000
 
+    compression_threshold = 512
+    """Messages smaller than this are sent uncompressed."""
+
+    drain_threshold = 0x10000
+    """Drain the writer once per this many sent payload bytes."""
+
+    buffer_pool = []
+    """A small LIFO pool of recycled message assembly buffers."""
+
+    buffer_pool_size = 32
+
+    max_pending_messages = 1024
+    """Upper bound of partially received messages held at once."""
+
+    _ack_flags = Header.encode_flags(eom=True, recv_ack=True)
+    """Precomputed flag bits of an acknowledgement header."""
+
     # pylint: disable=E0602
     log = logging.getLogger(__module__ + '.' + __qualname__)
 
@@ -495,6 +572,22 @@ class Channels:
         self.reader = reader
         self.writer = writer
 
+        self._channel_name_cache = {}
+        """Maps raw channel name bytes to their decoded string."""
+
+        self._encoded_name_cache = {}
+        """Maps channel names to their encoded bytes for sending."""
+
+        self._decompressors = {}
+        """Streaming decompression state per message uid."""
+
+        self._evicted_uids = set()
+        """Uids of evicted incomplete messages, their remaining chunks
+        are discarded instead of reassembled into a torso."""
+
+        self._debug = self.log.isEnabledFor(logging.DEBUG)
+        """Cached debug flag to keep argument tuples off the chunk path."""
+
         self._lock_communicate = asyncio.Lock(loop=self.loop)
 
     def get_channel(self, channel_name):
@@ -540,22 +633,52 @@ class Channels:
         # read header
         raw_header = await self.reader.readexactly(Header.size)
         header = Header(raw_header)
-        self.log.debug('read header: %s', repr(header))
-
-        # read channel name
-        channel_name = \
-            (await self.reader.readexactly(header.channel_name_len)).decode() \
-            if header.channel_name_len else None
-        self.log.debug('read channel_name: %s', channel_name)
-
-        # read data
-        if header.data_len:
-            data = await self.reader.readexactly(header.data_len)
-            if header.compression:
-                data = zlib.decompress(data)
+        if self._debug:
+            self.log.debug('read header: %r', header)
+
+        # channel name and data are consecutive on the wire,
+        # so fetch both with a single read
+        name_len, data_len = header.channel_name_len, header.data_len
+        rest = await self.reader.readexactly(name_len + data_len) \
+            if name_len or data_len else None
+
+        if name_len:
+            raw_name = bytes(rest[:name_len])
+            # a message arrives in many chunks but the name decodes once
+            channel_name = self._channel_name_cache.get(raw_name)
+            if channel_name is None:
+                if len(self._channel_name_cache) >= 1024:
+                    # fqin based names are unique per command instance,
+                    # keep the cache from growing without bounds
+                    self._channel_name_cache.clear()
+                channel_name = raw_name.decode()
+                self._channel_name_cache[raw_name] = channel_name
+        else:
+            channel_name = None
+        if self._debug:
+            self.log.debug('read channel_name: %s', channel_name)
+
+        if data_len:
+            if header.uid in self._evicted_uids:
+                # the rest of an evicted message - discard it before it
+                # recreates decompression or reassembly state
+                data = None
+            else:
+                data = memoryview(rest)[name_len:] if name_len else rest
+                if header.compression:
+                    # the sender streams all parts of a message through
+                    # one compressor, so decompression state lives per
+                    # uid
+                    try:
+                        decompressor = self._decompressors[header.uid]
+                    except KeyError:
+                        decompressor = self._decompressors[header.uid] \
+                            = zlib.decompressobj()
+                    data = decompressor.decompress(data)
         else:
             data = None
-        self.log.debug('read data: %s', header.data_len)
+        if self._debug:
+            self.log.debug('read data: %s', header.data_len)
 
         chunk = Chunk(header, channel_name, data)
         return chunk
@@ -572,50 +695,92 @@ class Channels:
             await self._send_ack(chunk.header.uid)
 
         if chunk.header.eom:
+            self._decompressors.pop(chunk.header.uid, None)
+            # an evicted message ends here, drop its tombstone
+            self._evicted_uids.discard(chunk.header.uid)
+
             # put message into channel queue
-            if chunk.header.uid in buffer and chunk.channel_name:
-                msg = msgpack.decode(buffer[chunk.header.uid])
-                self.log.debug('%s - decoded message %s for channel: %s',
-                               chunk.header.uid, msg, chunk.channel_name)
+            # pop the assembled bytearray in one go, msgpack decodes it
+            # without a prior copy into bytes
+            data = buffer.pop(chunk.header.uid, None)
+            if data is not None and chunk.channel_name:
                 try:
-                    # try to store message in channel
-                    queue = self.incomming[chunk.channel_name]
-                    self.log.debug('Put message %s into queue: %s', msg,
-                                   chunk.channel_name)
-                    await queue.put(msg)
+                    msg = msgpack.decode(data)
                 except Exception:   # pylint: disable=W0703
+                    # one bad reassembly must not take down the
+                    # receive loop
                     self.log.error(
-                        'Error while putting message %s into queue: %s',
-                        msg, chunk.channel_name)
-                finally:
-                    del buffer[chunk.header.uid]
+                        '%s: error decoding message for channel %s:\n%s',
+                        chunk.header.uid, chunk.channel_name,
+                        traceback.format_exc())
+                else:
+                    if self._debug:
+                        self.log.debug(
+                            '%s - decoded message %s for channel: %s',
+                            chunk.header.uid, msg, chunk.channel_name)
+                    try:
+                        # try to store message in channel
+                        queue = self.incomming[chunk.channel_name]
+                        if self._debug:
+                            self.log.debug('Put message %s into queue: %s',
+                                           msg, chunk.channel_name)
+                        await queue.put(msg)
+                    except Exception:   # pylint: disable=W0703
+                        self.log.error(
+                            'Error while putting message %s into queue: %s',
+                            msg, chunk.channel_name)
+                if len(self.buffer_pool) < self.buffer_pool_size:
+                    # recycle the assembly buffer
+                    del data[:]
+                    self.buffer_pool.append(data)
 
             # acknowledge reception
-            ack_future = self.acknowledgements.get(chunk.header.uid)
-            if ack_future and chunk.header.recv_ack:
-                try:
+            if chunk.header.recv_ack:
+                ack_future = self.acknowledgements.pop(chunk.header.uid, None)
+                if ack_future:
                     self.log.debug("%s: acknowledge", chunk.header.uid)
                     duration = time.time() - chunk.header.uid.time
                     ack_future.set_result((chunk.header.uid, duration))
-                finally:
-                    del self.acknowledgements[chunk.header.uid]
 
-    @classmethod
-    def _feed_data(cls, buffer, chunk):
-        if chunk.data:
-            if chunk.header.uid not in buffer:
-                buffer[chunk.header.uid] = bytearray()
-
-            buffer[chunk.header.uid].extend(chunk.data)
+    def _evict(self, uid):
+        """Evict an incomplete message and tombstone its uid, so chunks
+        of it still in flight are discarded instead of reassembled into
+        a truncated message."""
+        if len(self._evicted_uids) >= 1024:
+            self._evicted_uids.clear()
+        self._evicted_uids.add(uid)
+        # drop the decompression state along with the buffer entry,
+        # otherwise it would leak until an eom that may never come
+        self._decompressors.pop(uid, None)
+        self.log.warning('%s: evicted incomplete message', uid)
+
+    def _feed_data(self, buffer, chunk):
+        if chunk.data and chunk.header.uid not in self._evicted_uids:
+            try:
+                buffer[chunk.header.uid].extend(chunk.data)
+                buffer.move_to_end(chunk.header.uid)
+            except KeyError:
+                if self.buffer_pool:
+                    buf = self.buffer_pool.pop()
+                    buf.extend(chunk.data)
+                else:
+                    buf = bytearray(chunk.data)
+                buffer[chunk.header.uid] = buf
+                if len(buffer) > self.max_pending_messages:
+                    # a peer sending partials without eom must not let
+                    # the buffer grow without bounds
+                    uid, _ = buffer.popitem(last=False)
+                    self._evict(uid)
 
         # debug
-        if chunk.channel_name:
-            cls.log.debug("%s: channel `%s` receives: %s bytes",
-                          chunk.header.uid, chunk.channel_name,
-                          len(chunk.data) if chunk.data else 0)
-        else:
-            cls.log.debug("%s: no channel received: %s",
-                          chunk.header.uid, chunk.header)
+        if self._debug:
+            if chunk.channel_name:
+                self.log.debug("%s: channel `%s` receives: %s bytes",
+                               chunk.header.uid, chunk.channel_name,
+                               len(chunk.data) if chunk.data else 0)
+            else:
+                self.log.debug("%s: no channel received: %s",
+                               chunk.header.uid, chunk.header)
 
     async def _receive_single_message(self, buffer):
         chunk = await self._read_chunk()
@@ -625,6 +790,8 @@ class Channels:
         await self._finalize_message(buffer, chunk)
 
     def _log_incomming(self):
+        if not self._debug:
+            return
         self.log.debug('Active channels:')
         for key, queue in self.incomming.items():
             self.log.debug('\t%s: %s', key, queue.qsize())
@@ -633,7 +800,8 @@ class Channels:
         """Start reception of messages."""
         # receive incomming data into queues
         self.log.info("Start receiving from %s...", self.reader)
-        buffer = {}
+        # lru ordered, see _feed_data for the eviction of stale entries
+        buffer = collections.OrderedDict()
         try:
             while True:
                 await self._receive_single_message(buffer)
@@ -656,16 +824,19 @@ class Channels:
 
         :param uid: :py:obj:`Uid`
         """
-        # no channel_name, no data
-        header = Header(uid=uid, eom=True, recv_ack=True)
-        self.log.debug("%s: send acknowledgement", uid)
+        # no channel_name, no data - only the uid varies
+        header = Header.encode_frame(self._ack_flags, uid.bytes, 0, 0)
+        if self._debug:
+            self.log.debug("%s: send acknowledgement", uid)
         await self._send_raw(header)
 
     async def _send_raw(self, *data):
-        for part in data:
-            self.writer.write(part)
-            await self.writer.drain()
-        self.log.debug('send raw data: %s', sum(map(len, data)))
+        # gather header, name and payload into a single transport write
+        # and pay the drain suspension only once
+        self.writer.writelines(data)
+        await self.writer.drain()
+        if self._debug:
+            self.log.debug('send raw data: %s', sum(map(len, data)))
 
     async def send(self, channel_name, data, ack=False, compress=6):
         """Send data in a encoded form to the channel.
@@ -678,27 +849,74 @@ class Channels:
         Messages are split into chunks and put into the outgoing queue.
         """
         uid = Uid()
-        encoded_channel_name = channel_name.encode()
+        # a channel sends many messages under the same name,
+        # encode it only the first time
+        encoded_channel_name = self._encoded_name_cache.get(channel_name)
+        if encoded_channel_name is None:
+            if len(self._encoded_name_cache) >= 1024:
+                # fqin based names are unique per command instance
+                self._encoded_name_cache.clear()
+            encoded_channel_name = channel_name.encode()
+            self._encoded_name_cache[channel_name] = encoded_channel_name
         encoded_data = msgpack.encode(data)
         channel_name_len = len(encoded_channel_name)
-        self.log.debug("%s: channel `%s` sends: %s bytes",
-                       uid, channel_name, len(encoded_data))
-
-        for part in split_data(encoded_data, self.chunk_size):
-            if compress:
+        if self._debug:
+            self.log.debug("%s: channel `%s` sends: %s bytes",
+                           uid, channel_name, len(encoded_data))
+
+        if compress and len(encoded_data) < self.compression_threshold:
+            # typical command envelopes are too small for zlib to gain
+            # anything - skip the compressor altogether
+            compress = False
+
+        # flags and uid never change within one message,
+        # encode them once and only vary the data length per part
+        uid_bytes = uid.bytes
+        part_flags = Header.encode_flags(compression=bool(compress))
+
+        # most messages fit into a single chunk - no need for the
+        # generator and its memoryview slicing then
+        if len(encoded_data) <= self.chunk_size:
+            parts = (encoded_data,)
+        else:
+            parts = split_data(encoded_data, self.chunk_size)
+
+        # the compression mode is fixed for the whole message,
+        # so decide it once instead of per part
+        # parts pile up in the transport buffer and are drained in
+        # batches of at least drain_threshold payload bytes
+        pending = 0
+        if compress:
+            # one streaming compressor for the whole message shares the
+            # dictionary across parts instead of restarting per chunk
+            compressor = zlib.compressobj(compress)
+            for part in parts:
                 raw_len = len(part)
-                part = zlib.compress(part, compress)
+                part = compressor.compress(part) \
+                    + compressor.flush(zlib.Z_SYNC_FLUSH)
                 comp_len = len(part)
 
-                self.log.debug("%s: compression ratio of %s -> %s: %.2f%%",
-                               uid, raw_len, comp_len,
-                               comp_len * 100 / raw_len)
-
-            header = Header(uid=uid, channel_name_len=channel_name_len,
-                            data_len=len(part), eom=False, send_ack=False,
-                            compression=bool(compress))
-            self.log.debug('%s - send part', uid)
-            await self._send_raw(header, encoded_channel_name, part)
+                if self._debug:
+                    self.log.debug(
+                        "%s: compression ratio of %s -> %s: %.2f%%",
+                        uid, raw_len, comp_len, comp_len * 100 / raw_len)
+
+                header = Header.encode_frame(part_flags, uid_bytes,
+                                             channel_name_len, comp_len)
+                self.writer.writelines((header, encoded_channel_name, part))
+                pending += comp_len
+                if pending >= self.drain_threshold:
+                    await self.writer.drain()
+                    pending = 0
+        else:
+            for part in parts:
+                header = Header.encode_frame(part_flags, uid_bytes,
+                                             channel_name_len, len(part))
+                self.writer.writelines((header, encoded_channel_name, part))
+                pending += len(part)
+                if pending >= self.drain_threshold:
+                    await self.writer.drain()
+                    pending = 0
 
         # if acknowledgement is asked for, we await this future
         # and return its result
@@ -707,9 +925,11 @@ class Channels:
             ack_future = asyncio.Future(loop=self.loop)
             self.acknowledgements[uid] = ack_future
 
-        header = Header(uid=uid, channel_name_len=channel_name_len, data_len=0,
-                        eom=True, send_ack=ack, compression=False)
-        self.log.debug('%s - send eom', uid)
+        header = Header.encode_frame(
+            Header.encode_flags(eom=True, send_ack=ack),
+            uid_bytes, channel_name_len, 0)
+        if self._debug:
+            self.log.debug('%s - send eom', uid)
         await self._send_raw(header, encoded_channel_name)
 
         if ack:
@@ -720,12 +940,19 @@ class Channels:
             return acknowledgement
 
 
-class Channel(asyncio.Queue):
+class Channel:
 
     """Channel provides means to send and receive messages bound to
     a specific channel name.
+
+    A channel has a single producer and a single consumer, so a plain
+    deque with one data available event replaces the general purpose
+    :py:obj:`python:asyncio.Queue` and its per operation futures.
     """
 
+    __slots__ = ('loop', 'name', 'send', '_queue', '_data_available',
+                 '__weakref__')
+
     def __init__(self, name=None, *, send, loop=None):
         """Initialize the channel.
 
@@ -734,26 +961,38 @@ class Channel(asyncio.Queue):
         :param loop: the event loop
 
         """
-        super().__init__(loop=loop)
+        self.loop = loop if loop is not None else asyncio.get_event_loop()
         self.name = name
         self.send = send
         """The send method bound to this channel's name.
         See :py:func:`Channels.send` for details.
         """
 
+        self._queue = collections.deque()
+        self._data_available = asyncio.Event(loop=self.loop)
+
     def __repr__(self):
         return '<{0.name} {in_size}>'.format(
             self,
             in_size=self.qsize(),
         )
 
+    def qsize(self):
+        """Number of messages waiting in this channel."""
+        return len(self._queue)
+
+    async def put(self, item):
+        """Enqueue a message - the single producer never blocks."""
+        self._queue.append(item)
+        self._data_available.set()
+
     async def pop(self):
         """Get one item from the queue and remove it on return."""
-        msg = await super().get()
-        try:
-            return msg
-        finally:
-            self.task_done()
+        queue = self._queue
+        while not queue:
+            self._data_available.clear()
+            await self._data_available.wait()
+        return queue.popleft()
 
     def __await__(self):
         """Receive the next message in this channel."""
@@ -836,18 +1075,36 @@ class Dispatcher:
         self.channel = self.channels.get_channel(DISPATCHER_CHANNEL_NAME)
         """A channel for the dispatcher itself."""
 
-        self.pending_commands = collections.defaultdict(
-            functools.partial(asyncio.Future, loop=self.loop))
+        self.pending_commands = {}
         """Futures of :py:obj:`Command` s which are not finished yet."""
 
-        self.pending_dispatches = collections.defaultdict(
-            functools.partial(asyncio.Event, loop=self.loop))
+        self.pending_dispatches = {}
         """A collection of dispatches, which are still not finished."""
 
         self.pending_remote_tasks = set()
 
         self._lock_dispatch = asyncio.Lock(loop=self.loop)
 
+    def _pending_command(self, fqin):
+        """Get or create the future for a pending command.
+
+        A plain dict lookup, so stray reads cannot silently
+        resurrect state like a defaultdict would.
+        """
+        future = self.pending_commands.get(fqin)
+        if future is None:
+            future = self.pending_commands[fqin] \
+                = asyncio.Future(loop=self.loop)
+        return future
+
+    def _pending_dispatch(self, fqin):
+        """Get or create the ready event for a pending dispatch."""
+        evt = self.pending_dispatches.get(fqin)
+        if evt is None:
+            evt = self.pending_dispatches[fqin] \
+                = asyncio.Event(loop=self.loop)
+        return evt
+
     async def dispatch(self):
         """Start sending and receiving messages and executing them."""
         async with self._lock_dispatch:
@@ -918,10 +1175,12 @@ class Dispatcher:
         async with self.remote_future(fqin, command) as future:
             context = self.local_context(fqin, future)
             try:
-                evt_dispatch_ready = self.pending_dispatches[fqin]
+                evt_dispatch_ready = self._pending_dispatch(fqin)
                 self.log.info(
                     "[2] %s - waiting for remote dispatch to be ready", fqin)
                 await evt_dispatch_ready.wait()
+                # the event served its purpose, keep the dict compact
+                self.pending_dispatches.pop(fqin, None)
                 self.log.info("[4] %s - execute local command", fqin)
                 # execute local side of command
                 result = await command.local(context)
@@ -941,11 +1200,11 @@ class Dispatcher:
         class _context:
             async def __aenter__(ctx):      # noqa
                 # send execution request to remote
-                future = self.pending_commands[fqin]
+                future = self._pending_command(fqin)
                 return future
 
             async def __aexit__(ctx, *args):        # noqa
-                del self.pending_commands[fqin]
+                self.pending_commands.pop(fqin, None)
 
         return _context()
 
@@ -1016,19 +1275,19 @@ class Dispatcher:
         """Sets the pending dispatch ready, so the command execution
         continues.
         """
-        evt = self.pending_dispatches[fqin]
+        evt = self._pending_dispatch(fqin)
         evt.set()
         self.log.info("[3] %s - set dispatch ready", fqin)
 
     def set_dispatch_exception(self, fqin, tb, exception):
         """Set an exception for a pending command."""
-        future = self.pending_commands[fqin]
+        future = self._pending_command(fqin)
         future.set_exception(exception)
         self.log.info("[0] %s - Dispatch exception:\n%s", fqin, tb)
 
     def set_dispatch_result(self, fqin, result):
         """Set a result for a pending command."""
-        future = self.pending_commands[fqin]
+        future = self._pending_command(fqin)
         future.set_result(result)
         self.log.info("[5] %s - Dispatch result", fqin)
 
@@ -1060,7 +1319,9 @@ class _CommandMeta(type):
         Add command_name as __module__:__qualname__
         Collect parameters
         """
-        dct['command_name'] = dct['__module__'] + ':' + dct['__qualname__']
+        # interned, so registry lookups short-circuit on identity
+        dct['command_name'] = sys.intern(
+            dct['__module__'] + ':' + dct['__qualname__'])
         dct['parameters'] = {name: attr
                              for name, attr in dct.items()
                              if isinstance(attr, Parameter)}
@@ -1108,8 +1369,12 @@ class _CommandMeta(type):
     async def create_command(cls, command_name, params, *, loop):
         """Create a command."""
         module_name, command_class_name = command_name.split(':')
-        module = sys.modules.get(module_name, await async_import(module_name,
-                                                                 loop=loop))
+        # fast path for already imported modules: the default of
+        # dict.get is evaluated eagerly, which would run the full
+        # import machinery in an executor on every dispatch
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = await async_import(module_name, loop=loop)
         command_class = getattr(module, command_class_name)
 
         if isinstance(command_class.remote, CommandRemote):
@@ -1455,6 +1720,9 @@ class FindSpecData(Command):
 
     fullname = Parameter(description='The full module name to find.')
 
+    source_cache = {}
+    """Module sources by origin, validated against their mtime."""
+
     async def local(self, context):     # noqa
         spec_data = await context.remote_future
         return spec_data
@@ -1475,18 +1743,38 @@ class FindSpecData(Command):
             'namespace': (spec.loader is None
                           and spec.submodule_search_locations is not None),
             'package': isinstance(spec.submodule_search_locations, list),
-            'source': (spec.loader.get_source(spec.name)
-                       if isinstance(spec.loader, importlib.abc.InspectLoader)
-                       else None),
+            'source': self._get_source(spec),
         }
         return spec_data
 
+    @classmethod
+    def _get_source(cls, spec):
+        """Get the module source, cached as long as the file stays
+        unchanged."""
+        if not isinstance(spec.loader, importlib.abc.InspectLoader):
+            return None
+        try:
+            mtime = os.stat(spec.origin).st_mtime
+        except (OSError, TypeError, ValueError):
+            # no stat-able origin - serve uncached
+            return spec.loader.get_source(spec.name)
+        cached = cls.source_cache.get(spec.origin)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        source = spec.loader.get_source(spec.name)
+        cls.source_cache[spec.origin] = (mtime, source)
+        return source
+
 
-class RemoteModuleFinder(importlib.abc.MetaPathFinder):
+class RemoteModuleFinder:
 
     """Import hook that execute a :py:obj:`FindSpecData` command in the main
     loop.
 
+    The import machinery looks all methods up by name, so the
+    :py:obj:`python:importlib.abc` registration is not needed and its
+    metaclass is kept out of the import hot path.
+
     See `pep-0302`_, `pep-0420`_ and `pep-0451`_ for internals.
 
     .. _pep-0302: https://www.python.org/dev/peps/pep-0302/
@@ -1496,18 +1784,51 @@ class RemoteModuleFinder(importlib.abc.MetaPathFinder):
 
     log = logging.getLogger(__module__ + '.' + __qualname__)    # noqa
 
+    __slots__ = ('dispatcher', 'loop', '_pending', '_pending_lock',
+                 '_spec_data_cache', '_debug')
+
     def __init__(self, dispatcher, *, loop):
         self.dispatcher = dispatcher
         self.loop = loop
+        self._pending = {}
+        """In-flight spec data requests shared between importer threads."""
+
+        self._pending_lock = threading.Lock()
+
+        self._spec_data_cache = {}
+        """Resolved spec data - hits and misses - by module name."""
+
+        self._debug = self.log.isEnabledFor(logging.DEBUG)
+        """Cached debug flag, the import system probes a lot."""
 
     def _find_remote_spec_data(self, fullname):
-        self.log.debug('Find spec data: %s', fullname)
-        future = asyncio.run_coroutine_threadsafe(
-            self.dispatcher.execute(FindSpecData, fullname=fullname),
-            loop=self.loop
-        )
-        spec_data = future.result()
-        self.log.debug('Spec data found: %s', fullname)
+        try:
+            # the import system probes repeatedly, remember misses too
+            return self._spec_data_cache[fullname]
+        except KeyError:
+            pass
+        if self._debug:
+            self.log.debug('Find spec data: %s', fullname)
+        # importer threads asking for the same module share one rpc
+        with self._pending_lock:
+            future = self._pending.get(fullname)
+            owner = future is None
+            if owner:
+                future = self._pending[fullname] \
+                    = asyncio.run_coroutine_threadsafe(
+                        self.dispatcher.execute(FindSpecData,
+                                                fullname=fullname),
+                        loop=self.loop
+                    )
+        try:
+            spec_data = future.result()
+        finally:
+            if owner:
+                with self._pending_lock:
+                    self._pending.pop(fullname, None)
+        self._spec_data_cache[fullname] = spec_data
+        if self._debug:
+            self.log.debug('Spec data found: %s', fullname)
         return spec_data
 
     @staticmethod
@@ -1542,7 +1863,8 @@ class RemoteModuleFinder(importlib.abc.MetaPathFinder):
 
     def find_spec(self, fullname, path, target=None):
         """Find the spec of the module."""
-        self.log.debug('find spec: %s', fullname)
+        if self._debug:
+            self.log.debug('find spec: %s', fullname)
         spec_data = self._find_remote_spec_data(fullname)
         if spec_data is None:
             spec = None
@@ -1553,9 +1875,19 @@ class RemoteModuleFinder(importlib.abc.MetaPathFinder):
         return spec
 
 
-class RemoteModuleLoader(importlib.abc.ExecutionLoader):
+class RemoteModuleLoader:
+
+    """Load the found module spec.
+
+    A plain duck typed loader - see :py:obj:`RemoteModuleFinder` for
+    the reasoning.
+    """
+
+    __slots__ = ('source', 'filename', '_is_package')
 
-    """Load the found module spec."""
+    code_cache = {}
+    """Compiled code objects by filename and source hash, shared per
+    process."""
 
     def __init__(self, source, filename=None, is_package=False):
         self.source = source
@@ -1574,6 +1906,34 @@ class RemoteModuleLoader(importlib.abc.ExecutionLoader):
     def get_source(self, fullname):
         return self.source
 
+    def get_code(self, fullname):
+        """Compile the module source once per filename and source hash.
+
+        The filename is part of the key - identical sources of distinct
+        modules must not share a code object, its co_filename would
+        point tracebacks at the wrong file.
+        """
+        if self.source is None:
+            raise ImportError(
+                'No source for module: {}'.format(fullname))
+        key = (self.filename, hashlib.md5(self.source.encode()).digest())
+        code = self.code_cache.get(key)
+        if code is None:
+            code = self.code_cache[key] = compile(
+                self.source, self.get_filename(fullname), 'exec',
+                dont_inherit=True)
+        return code
+
+    @staticmethod
+    def create_module(spec):
+        """Use default module creation semantics."""
+        return None
+
+    def exec_module(self, module):
+        """Execute the compiled module code, formerly inherited from
+        :py:obj:`python:importlib.abc.ExecutionLoader`."""
+        exec(self.get_code(module.__name__), module.__dict__)
+
     @classmethod
     def module_repr(cls, module):
         return "<module '{}'>".format(module.__name__)
@@ -1747,7 +2107,19 @@ class Core:
     @classmethod
     def main(cls, debug=False, log_config=None, *, loop=None, **kwargs):
         """Start the event loop and schedule core communication."""
-        loop = loop if loop is not None else asyncio.get_event_loop()
+        if loop is None:
+            # prefer uvloop if the remote interpreter happens to have
+            # it - the core itself must never depend on it
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                pass
+            loop = asyncio.get_event_loop()
+
+        if hasattr(asyncio, 'eager_task_factory'):
+            # run synchronous coroutine prefixes inline (python 3.12+)
+            loop.set_task_factory(asyncio.eager_task_factory)
 
         thread_pool_executor = concurrent.futures.ThreadPoolExecutor()
         loop.set_default_executor(thread_pool_executor)
@@ -1763,4 +2135,21 @@ class Core:
         cls.log.info("exit")
 
 
+def _reset_fork_state():
+    """Drop per process caches inherited from the parent.
+
+    A forked child must not keep recycled receive buffers or cache
+    entries sized for the parent's workload.
+    """
+    Uid._interned.clear()               # pylint: disable=W0212
+    Channels.buffer_pool.clear()
+    FindSpecData.source_cache.clear()
+    RemoteModuleLoader.code_cache.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    # python 3.7+
+    os.register_at_fork(after_in_child=_reset_fork_state)
+
+
 main = Core.main
@@ -57,8 +57,20 @@ async def log_remote_stderr(remote):
     # await remote.launched()
     if remote.stderr:
         log.info("Logging remote stderr: %s", remote)
-        async for line in remote.stderr:
-            log.debug("\tRemote #%s: %s", remote.pid, line[:-1].decode())
+        # read blocks instead of lines to avoid a coroutine round trip
+        # for every single line of a chatty remote
+        tail = bytearray()
+        while True:
+            block = await remote.stderr.read(0x10000)
+            if not block:
+                break
+            tail.extend(block)
+            lines = tail.split(b'\n')
+            tail = bytearray(lines.pop())
+            for line in lines:
+                log.debug("\tRemote #%s: %s", remote.pid, line.decode())
+        if tail:
+            log.debug("\tRemote #%s: %s", remote.pid, tail.decode())
 
 
 class Console:
@@ -66,6 +78,14 @@ class Console:
         self.loop = loop if loop is not None else asyncio.get_event_loop()
         self.options = options
         self.connectors = connectors
+        # mutable cell read by the signal handler, so the handler itself
+        # is registered only once per console
+        self._running = None
+        self._sigint_installed = False
+
+    def _cancel_running(self):
+        if self._running is not None:
+            self._running.cancel()
 
     async def feed_stdin_to_remotes(self, remotes):
         try:
@@ -73,7 +93,7 @@ class Console:
                 while True:
                     line = await reader.readline()
 
-                    if line == b'':
+                    if not line:
                         break
 
                     result = await asyncio.gather(
@@ -94,19 +114,23 @@ class Console:
             error_log.cancel()
             await error_log
 
-    async def connect(self):
-        remotes = {}
-        for connector, default_args in self.connectors.items():
-            if remotes.get(connector, None) is not None:
-                log.warning('Process for %s already launched! Skipping...', connector)
-                continue
-            remote = await connector.launch(
-                options=self.options, **default_args, loop=self.loop
-            )
-            fut_remote = asyncio.ensure_future(remote.communicate(), loop=self.loop)
-            error_log = asyncio.ensure_future(log_remote_stderr(remote), loop=self.loop)
-            remotes[connector] = (remote, fut_remote, error_log)
+    async def _launch(self, connector, default_args):
+        remote = await connector.launch(
+            options=self.options, **default_args, loop=self.loop
+        )
+        fut_remote = asyncio.ensure_future(remote.communicate(), loop=self.loop)
+        error_log = asyncio.ensure_future(log_remote_stderr(remote), loop=self.loop)
+        return connector, (remote, fut_remote, error_log)
 
+    async def connect(self):
+        # remote launches are independent of each other,
+        # so run them concurrently instead of one after the other
+        launched = await asyncio.gather(
+            *(self._launch(connector, default_args)
+              for connector, default_args in self.connectors.items()),
+            loop=self.loop
+        )
+        remotes = dict(launched)
         return remotes
 
     async def run(self):
@@ -115,11 +139,10 @@ class Console:
         remotes = await self.connect()
         feeder = asyncio.ensure_future(self.feed_stdin_to_remotes(remotes), loop=self.loop)
 
-        def _sigint_handler():
-            log.info('SIGINT...')
-            never_ending.cancel()
-
-        self.loop.add_signal_handler(signal.SIGINT, _sigint_handler)
+        self._running = never_ending
+        if not self._sigint_installed:
+            self.loop.add_signal_handler(signal.SIGINT, self._cancel_running)
+            self._sigint_installed = True
 
         try:
             await never_ending
@@ -131,15 +154,17 @@ class Console:
         await feeder
 
 
+def _sigint_noop():
+    log.error('Noop on signal SIGINT')
+
+
 def main(debug=False, log_config=None):
     log.info('deballator master process: %s', os.getpid())
     loop = asyncio.get_event_loop()
 
     # replace existing signal handler with noop as long as our remotes are not fully running
     # otherwise cancellation of process startup will lead to orphaned remote processes
-    def noop():
-        log.error('Noop on signal SIGINT')
-    loop.add_signal_handler(signal.SIGINT, noop)
+    loop.add_signal_handler(signal.SIGINT, _sigint_noop)
 
     options = {
         'debug': debug,
@@ -181,9 +206,15 @@ def main(debug=False, log_config=None):
         core.log.error("Error %s:\n%s", type(ex), traceback.format_exc())
 
     finally:
-        for task in asyncio.Task.all_tasks():
-            if not task.done():
-                log.error("pending: %s", task)
+        # cancel leftovers and await them in a single gather instead of
+        # just complaining about each one
+        pending = [t for t in asyncio.Task.all_tasks() if not t.done()]
+        if pending:
+            log.error("pending: %s", pending)
+            for t in pending:
+                t.cancel()
+            loop.run_until_complete(asyncio.gather(
+                *pending, loop=loop, return_exceptions=True))
     log.info(' - '.join(["this is the end"] * 3))
     loop.stop()
     loop.close()
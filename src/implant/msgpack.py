@@ -180,6 +180,10 @@ class EncoderMeta(type):
     else:
         _float_precision = "single"
 
+    # memoize the mro lookup of ext handlers per class, keyed also by the
+    # number of registered handlers to survive late registrations
+    _ext_handler_memo = {}
+
     def _pack_integer(cls, obj, fp, options):
         if obj < 0:
             if obj >= -32:
@@ -316,11 +320,19 @@ class EncoderMeta(type):
     def pack(cls, obj, fp, **options):
         # pylint: disable=W0212
         ext_handlers = options.get("ext_handlers")
-        # lookup mro except object for matching handler
-        ext_handler_match = next((
-            obj_cls for obj_cls in obj.__class__.__mro__[:-1]
-            if obj_cls in ext_handlers
-        ), None) if ext_handlers else None
+        if ext_handlers:
+            memo_key = (obj.__class__, len(ext_handlers))
+            try:
+                ext_handler_match = cls._ext_handler_memo[memo_key]
+            except KeyError:
+                # lookup mro except object for matching handler
+                ext_handler_match = next((
+                    obj_cls for obj_cls in obj.__class__.__mro__[:-1]
+                    if obj_cls in ext_handlers
+                ), None)
+                cls._ext_handler_memo[memo_key] = ext_handler_match
+        else:
+            ext_handler_match = None
         if obj is None:
             cls._pack_nil(obj, fp, options)
         elif ext_handler_match:
@@ -391,72 +403,63 @@ class Encoder(metaclass=EncoderMeta):
 
 class _DecoderMeta(type):
 
-    _unpack_dispatch_table = {}
+    # indexed by the integer type code for a plain list lookup
+    _unpack_dispatch_table = [None] * 0x100
 
     def __new__(mcs, name, bases, dct):     # noqa
         cls = type.__new__(mcs, name, bases, dct)
 
         # Build a dispatch table for fast lookup of unpacking function
+        table = cls._unpack_dispatch_table
         # Fix uint
         for code in range(0, 0x7f + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_integer
+            table[code] = cls._unpack_integer
         # Fix map
         for code in range(0x80, 0x8f + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_map
+            table[code] = cls._unpack_map
         # Fix array
         for code in range(0x90, 0x9f + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_array
+            table[code] = cls._unpack_array
         # Fix str
         for code in range(0xa0, 0xbf + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_string
+            table[code] = cls._unpack_string
         # Nil
-        cls._unpack_dispatch_table[b'\xc0'] = cls._unpack_nil
+        table[0xc0] = cls._unpack_nil
         # Reserved
-        cls._unpack_dispatch_table[b'\xc1'] = cls._unpack_reserved
+        table[0xc1] = cls._unpack_reserved
         # Boolean
-        cls._unpack_dispatch_table[b'\xc2'] = cls._unpack_boolean
-        cls._unpack_dispatch_table[b'\xc3'] = cls._unpack_boolean
+        table[0xc2] = cls._unpack_boolean
+        table[0xc3] = cls._unpack_boolean
         # Bin
         for code in range(0xc4, 0xc6 + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_binary
+            table[code] = cls._unpack_binary
         # Ext
         for code in range(0xc7, 0xc9 + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_ext
+            table[code] = cls._unpack_ext
         # Float
-        cls._unpack_dispatch_table[b'\xca'] = cls._unpack_float
-        cls._unpack_dispatch_table[b'\xcb'] = cls._unpack_float
+        table[0xca] = cls._unpack_float
+        table[0xcb] = cls._unpack_float
         # Uint
         for code in range(0xcc, 0xcf + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_integer
+            table[code] = cls._unpack_integer
         # Int
         for code in range(0xd0, 0xd3 + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_integer
+            table[code] = cls._unpack_integer
         # Fixext
         for code in range(0xd4, 0xd8 + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_ext
+            table[code] = cls._unpack_ext
         # String
         for code in range(0xd9, 0xdb + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_string
+            table[code] = cls._unpack_string
         # Array
-        cls._unpack_dispatch_table[b'\xdc'] = cls._unpack_array
-        cls._unpack_dispatch_table[b'\xdd'] = cls._unpack_array
+        table[0xdc] = cls._unpack_array
+        table[0xdd] = cls._unpack_array
         # Map
-        cls._unpack_dispatch_table[b'\xde'] = cls._unpack_map
-        cls._unpack_dispatch_table[b'\xdf'] = cls._unpack_map
+        table[0xde] = cls._unpack_map
+        table[0xdf] = cls._unpack_map
         # Negative fixint
         for code in range(0xe0, 0xff + 1):
-            cls._unpack_dispatch_table[struct.pack("B", code)]\
-                = cls._unpack_integer
+            table[code] = cls._unpack_integer
 
         return cls
 
@@ -468,68 +471,68 @@ class _DecoderMeta(type):
         return data
 
     def _unpack_integer(cls, code, fp, options):    # noqa
-        if (ord(code) & 0xe0) == 0xe0:
-            return struct.unpack("b", code)[0]
-        elif code == b'\xd0':
+        if (code & 0xe0) == 0xe0:
+            return code - 0x100
+        elif code == 0xd0:
             return struct.unpack("b", cls._read_except(fp, 1))[0]
-        elif code == b'\xd1':
+        elif code == 0xd1:
             return struct.unpack(">h", cls._read_except(fp, 2))[0]
-        elif code == b'\xd2':
+        elif code == 0xd2:
             return struct.unpack(">i", cls._read_except(fp, 4))[0]
-        elif code == b'\xd3':
+        elif code == 0xd3:
             return struct.unpack(">q", cls._read_except(fp, 8))[0]
-        elif (ord(code) & 0x80) == 0x00:
-            return struct.unpack("B", code)[0]
-        elif code == b'\xcc':
-            return struct.unpack("B", cls._read_except(fp, 1))[0]
-        elif code == b'\xcd':
+        elif (code & 0x80) == 0x00:
+            return code
+        elif code == 0xcc:
+            return cls._read_except(fp, 1)[0]
+        elif code == 0xcd:
             return struct.unpack(">H", cls._read_except(fp, 2))[0]
-        elif code == b'\xce':
+        elif code == 0xce:
             return struct.unpack(">I", cls._read_except(fp, 4))[0]
-        elif code == b'\xcf':
+        elif code == 0xcf:
             return struct.unpack(">Q", cls._read_except(fp, 8))[0]
-        raise Exception("logic error, not int: 0x%02x" % ord(code))
+        raise Exception("logic error, not int: 0x%02x" % code)
 
     @staticmethod
     def _unpack_reserved(code, fp, options):
-        if code == b'\xc1':
+        if code == 0xc1:
             raise ReservedCodeException(
-                "encountered reserved code: 0x%02x" % ord(code))
+                "encountered reserved code: 0x%02x" % code)
         raise Exception(
-            "logic error, not reserved code: 0x%02x" % ord(code))
+            "logic error, not reserved code: 0x%02x" % code)
 
     @staticmethod
     def _unpack_nil(code, fp, options):
-        if code == b'\xc0':
+        if code == 0xc0:
             return None
-        raise Exception("logic error, not nil: 0x%02x" % ord(code))
+        raise Exception("logic error, not nil: 0x%02x" % code)
 
     @staticmethod
     def _unpack_boolean(code, fp, options):
-        if code == b'\xc2':
+        if code == 0xc2:
             return False
-        elif code == b'\xc3':
+        elif code == 0xc3:
             return True
-        raise Exception("logic error, not boolean: 0x%02x" % ord(code))
+        raise Exception("logic error, not boolean: 0x%02x" % code)
 
     def _unpack_float(cls, code, fp, options):
-        if code == b'\xca':
+        if code == 0xca:
             return struct.unpack(">f", cls._read_except(fp, 4))[0]
-        elif code == b'\xcb':
+        elif code == 0xcb:
             return struct.unpack(">d", cls._read_except(fp, 8))[0]
-        raise Exception("logic error, not float: 0x%02x" % ord(code))
+        raise Exception("logic error, not float: 0x%02x" % code)
 
     def _unpack_string(cls, code, fp, options):
-        if (ord(code) & 0xe0) == 0xa0:
-            length = ord(code) & ~0xe0
-        elif code == b'\xd9':
-            length = struct.unpack("B", cls._read_except(fp, 1))[0]
-        elif code == b'\xda':
+        if (code & 0xe0) == 0xa0:
+            length = code & ~0xe0
+        elif code == 0xd9:
+            length = cls._read_except(fp, 1)[0]
+        elif code == 0xda:
             length = struct.unpack(">H", cls._read_except(fp, 2))[0]
-        elif code == b'\xdb':
+        elif code == 0xdb:
             length = struct.unpack(">I", cls._read_except(fp, 4))[0]
         else:
-            raise Exception("logic error, not string: 0x%02x" % ord(code))
+            raise Exception("logic error, not string: 0x%02x" % code)
 
         # Always return raw bytes in compatibility mode
         # global compatibility
@@ -545,38 +548,38 @@ class _DecoderMeta(type):
             raise InvalidStringException("unpacked string is invalid utf-8")
 
     def _unpack_binary(cls, code, fp, options):
-        if code == b'\xc4':
-            length = struct.unpack("B", cls._read_except(fp, 1))[0]
-        elif code == b'\xc5':
+        if code == 0xc4:
+            length = cls._read_except(fp, 1)[0]
+        elif code == 0xc5:
             length = struct.unpack(">H", cls._read_except(fp, 2))[0]
-        elif code == b'\xc6':
+        elif code == 0xc6:
             length = struct.unpack(">I", cls._read_except(fp, 4))[0]
         else:
-            raise Exception("logic error, not binary: 0x%02x" % ord(code))
+            raise Exception("logic error, not binary: 0x%02x" % code)
 
         return cls._read_except(fp, length)
 
     def _unpack_ext(cls, code, fp, options):        # noqa
-        if code == b'\xd4':
+        if code == 0xd4:
             length = 1
-        elif code == b'\xd5':
+        elif code == 0xd5:
             length = 2
-        elif code == b'\xd6':
+        elif code == 0xd6:
             length = 4
-        elif code == b'\xd7':
+        elif code == 0xd7:
             length = 8
-        elif code == b'\xd8':
+        elif code == 0xd8:
             length = 16
-        elif code == b'\xc7':
-            length = struct.unpack("B", cls._read_except(fp, 1))[0]
-        elif code == b'\xc8':
+        elif code == 0xc7:
+            length = cls._read_except(fp, 1)[0]
+        elif code == 0xc8:
             length = struct.unpack(">H", cls._read_except(fp, 2))[0]
-        elif code == b'\xc9':
+        elif code == 0xc9:
             length = struct.unpack(">I", cls._read_except(fp, 4))[0]
         else:
-            raise Exception("logic error, not ext: 0x%02x" % ord(code))
+            raise Exception("logic error, not ext: 0x%02x" % code)
 
-        ext = Ext(ord(cls._read_except(fp, 1)), cls._read_except(fp, length))
+        ext = Ext(cls._read_except(fp, 1)[0], cls._read_except(fp, length))
 
         # Unpack with ext handler, if we have one
         ext_handlers = options.get("ext_handlers")
@@ -586,14 +589,14 @@ class _DecoderMeta(type):
         return ext
 
     def _unpack_array(cls, code, fp, options):
-        if (ord(code) & 0xf0) == 0x90:
-            length = (ord(code) & ~0xf0)
-        elif code == b'\xdc':
+        if (code & 0xf0) == 0x90:
+            length = (code & ~0xf0)
+        elif code == 0xdc:
             length = struct.unpack(">H", cls._read_except(fp, 2))[0]
-        elif code == b'\xdd':
+        elif code == 0xdd:
             length = struct.unpack(">I", cls._read_except(fp, 4))[0]
         else:
-            raise Exception("logic error, not array: 0x%02x" % ord(code))
+            raise Exception("logic error, not array: 0x%02x" % code)
 
         return [cls._unpack(fp, options) for i in range(length)]
 
@@ -603,14 +606,14 @@ class _DecoderMeta(type):
         return obj
 
     def _unpack_map(cls, code, fp, options):
-        if (ord(code) & 0xf0) == 0x80:
-            length = (ord(code) & ~0xf0)
-        elif code == b'\xde':
+        if (code & 0xf0) == 0x80:
+            length = (code & ~0xf0)
+        elif code == 0xde:
             length = struct.unpack(">H", cls._read_except(fp, 2))[0]
-        elif code == b'\xdf':
+        elif code == 0xdf:
             length = struct.unpack(">I", cls._read_except(fp, 4))[0]
         else:
-            raise Exception("logic error, not map: 0x%02x" % ord(code))
+            raise Exception("logic error, not map: 0x%02x" % code)
 
         d = {} if not options.get('use_ordered_dict') \
             else collections.OrderedDict()
@@ -644,7 +647,7 @@ class _DecoderMeta(type):
 class Decoder(metaclass=_DecoderMeta):
     @classmethod
     def _unpack(cls, fp, options):
-        code = cls._read_except(fp, 1)
+        code = cls._read_except(fp, 1)[0]
         return cls._unpack_dispatch_table[code](code, fp, options)
 
     @classmethod
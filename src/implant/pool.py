@@ -42,7 +42,7 @@ class RemotesPool(dict):
 
     async def shutdown(self, connector):
         """Shutdown a remote identified by its connector."""
-        loop = asyncio.get_event_loop()
+        loop = self.loop
         _, fut_remote, error_log = self[connector]
         loop.call_soon_threadsafe(fut_remote.cancel)
         await fut_remote
@@ -51,7 +51,7 @@ class RemotesPool(dict):
 
     async def stop(self):
         """Shutdown all remotes."""
-        loop = asyncio.get_event_loop()
+        loop = self.loop
         for _, fut_remote, error_log in self.values():
             loop.call_soon_threadsafe(fut_remote.cancel)
             await fut_remote
@@ -63,8 +63,21 @@ class RemotesPool(dict):
         # await remote.launched()
         if remote.stderr:
             self.log.info("Logging remote stderr: %s", remote)
-            async for line in remote.stderr:
-                self.log.debug("\tRemote #%s: %s", remote.pid, line[:-1].decode())
+            # read blocks instead of lines to avoid a coroutine round trip
+            # for every single line of a chatty remote
+            tail = bytearray()
+            while True:
+                block = await remote.stderr.read(0x10000)
+                if not block:
+                    break
+                tail.extend(block)
+                lines = tail.split(b'\n')
+                tail = bytearray(lines.pop())
+                for line in lines:
+                    self.log.debug("\tRemote #%s: %s", remote.pid,
+                                   line.decode())
+            if tail:
+                self.log.debug("\tRemote #%s: %s", remote.pid, tail.decode())
 
     @classmethod
     async def run_command_on_remotes(cls, *connectors,
@@ -72,9 +85,10 @@ class RemotesPool(dict):
                                      loop=None):
         """Connect remotes and run the command."""
         remotes_pool = cls(options, loop=loop)
-        # connect
-        for connector in connectors:
-            await remotes_pool.connect(connector)
+        # connect all remotes concurrently, their launches are independent
+        await asyncio.gather(
+            *(remotes_pool.connect(connector) for connector in connectors),
+            loop=remotes_pool.loop)
 
         # execute
         results = {connector: await remote.execute(command_cls, **command_params)
@@ -26,27 +26,29 @@ import pytest
 @mock.patch('implant.bootstrap.inspect')
 def test_bootstrap_iter(inspect, with_venv, venv_lines, options):
     from implant import bootstrap
-    import zlib
+    import lzma
     import base64
 
     inspect.getsource.return_value = 'msgpack-code'
     inspect.getsourcefile.return_value = 'msgpack-source-file'
-    msgpack_code = base64.b64encode(zlib.compress(b'msgpack-code', 9)).decode(),
+    msgpack_code = base64.b64encode(
+        lzma.compress(b'msgpack-code', preset=9 | lzma.PRESET_EXTREME)).decode(),
 
     lines = [
-        'import sys, imp, base64, zlib\n',
+        'import sys, imp, base64, lzma\n',
         'sys.modules["implant"] = implant = imp.new_module("implant")\n',
         'setattr(implant, "__path__", [])\n',
         'try:\n',
         '    from implant import msgpack\n',
         'except ImportError:\n',
         '    sys.modules["implant.msgpack"] = msgpack = imp.new_module("implant.msgpack")\n',
-        '    c = compile(zlib.decompress(base64.b64decode(b"{msgpack_code}")),'
+        '    c = compile(lzma.decompress(base64.b64decode(b"{msgpack_code}")),'
         ' "remote://msgpack-source-file", "exec")\n'.format(**locals()),
         '    exec(c, msgpack.__dict__)\n',
         'sys.modules["implant.core"] = core = imp.new_module("implant.core")\n',
         'implant.__dict__["core"] = core\n',
-        'c = compile(zlib.decompress(base64.b64decode(b"eNpLLC5OLSpRCCkqTQUAGlIEUw==")),'
+        'c = compile(lzma.decompress(base64.b64decode(b"/Td6WFoAAATm1rRGAgAhARwAAAAQ'
+        'z1jMAQAKYXNzZXJ0IFRydWUAAAPHaYL9OWaWAAEjC8Ib/QkftvN9AQAAAAAEWVo=")),'
         ' "remote-string://", "exec", dont_inherit=True)\n',
         'exec(c, core.__dict__)\n',
         'core.main(**msgpack.decode(base64.b64decode(b"{options}")))\n'.format(